@@ -0,0 +1,46 @@
+from typing import Optional, Tuple
+
+from .batch import evaluate_bitboards, evaluate_boards, numpy_available
+from .book import OpeningBook, build_book
+from .context import SearchContext
+from .evaluation import EvaluatedPosition, evaluate, evaluate_for
+from .position import BOARD_COLS, BOARD_ROWS, Position
+from .search import SearchAborted, Searcher
+from .solver import Solver, plies_to_end
+from .transposition import EXACT, LOWER_BOUND, UPPER_BOUND, TranspositionTable
+
+
+def best_move(position: Position, depth: Optional[int] = 6,
+              time_budget_ms: Optional[float] = None) -> Optional[int]:
+    return Searcher().best_move(position, depth, time_budget_ms)
+
+
+def solve(position: Position,
+          time_budget_ms: Optional[float] = None) -> Tuple[int, Optional[int]]:
+    return Solver().solve(position, time_budget_ms)
+
+
+__all__ = [
+    'BOARD_COLS',
+    'BOARD_ROWS',
+    'EXACT',
+    'LOWER_BOUND',
+    'UPPER_BOUND',
+    'EvaluatedPosition',
+    'OpeningBook',
+    'Position',
+    'SearchAborted',
+    'SearchContext',
+    'Searcher',
+    'Solver',
+    'TranspositionTable',
+    'best_move',
+    'build_book',
+    'evaluate',
+    'evaluate_bitboards',
+    'evaluate_boards',
+    'evaluate_for',
+    'numpy_available',
+    'plies_to_end',
+    'solve',
+]
@@ -0,0 +1,61 @@
+import importlib.util
+from typing import Sequence
+
+from .evaluation import CENTER_SCORES, WINDOWS, WINDOW_CODE_SCORES
+from .position import BOARD_COLS, BOARD_ROWS, cell_bit
+
+
+CELL_BITS = [cell_bit(row, col).bit_length() - 1
+             for row in range(BOARD_ROWS) for col in range(BOARD_COLS)]
+WINDOW_CELLS = [[cell for cell, bit in enumerate(CELL_BITS) if window >> bit & 1]
+                for window in WINDOWS]
+
+
+class NumpyTables:
+    def __init__(self, np):
+        self.np = np
+        self.window_index = np.array(WINDOW_CELLS, dtype=np.intp)
+        self.code_scores = np.array(WINDOW_CODE_SCORES, dtype=np.int64)
+        self.center_weights = np.array([CENTER_SCORES[bit] for bit in CELL_BITS], dtype=np.int64)
+        self.bit_index = np.array(CELL_BITS, dtype=np.uint64)
+        self.cell_codes = np.array([0, 5, 1], dtype=np.int8)
+        self.cell_signs = np.array([0, 1, -1], dtype=np.int64)
+
+
+numpy_tables = None
+
+
+def numpy_available() -> bool:
+    return numpy_tables is not None or importlib.util.find_spec('numpy') is not None
+
+
+def require_numpy() -> NumpyTables:
+    global numpy_tables
+    if numpy_tables is None:
+        try:
+            import numpy
+        except ImportError:
+            raise ImportError("numpy is required for batched evaluation") from None
+        numpy_tables = NumpyTables(numpy)
+    return numpy_tables
+
+
+def evaluate_boards(boards) -> 'numpy.ndarray':
+    tables = require_numpy()
+    np = tables.np
+    cells = np.asarray(boards, dtype=np.int8).reshape(-1, BOARD_ROWS * BOARD_COLS)
+
+    codes = tables.cell_codes[cells][:, tables.window_index].sum(axis=2)
+    scores = tables.code_scores[codes].sum(axis=1)
+    center = tables.cell_signs[cells] @ tables.center_weights
+    return scores + center
+
+
+def evaluate_bitboards(red: Sequence[int], yellow: Sequence[int]) -> 'numpy.ndarray':
+    tables = require_numpy()
+    np = tables.np
+    red = np.asarray(red, dtype=np.uint64)[:, None]
+    yellow = np.asarray(yellow, dtype=np.uint64)[:, None]
+
+    cells = ((red >> tables.bit_index) & 1) + 2 * ((yellow >> tables.bit_index) & 1)
+    return evaluate_boards(cells.astype(np.int8))
@@ -0,0 +1,72 @@
+import argparse
+import time
+from typing import List, Tuple
+
+from .position import Position
+from .search import Searcher
+from .transposition import TranspositionTable
+
+
+POSITIONS = [
+    '',
+    '4',
+    '44',
+    '4453',
+    '343544',
+    '4444335',
+    '32164625',
+    '445566',
+    '1234567',
+    '7665544',
+]
+
+
+def run(algorithm: str, depth: int, tt_size_mb: float = 16,
+        replacement: str = 'two-tier') -> Tuple[int, float, float, float, int, int, List[int]]:
+    searcher = Searcher(tt_size_mb, algorithm=algorithm, replacement=replacement)
+    nodes = 0
+    probes = 0
+    hits = 0
+    collisions = 0
+    overwrites = 0
+    cutoffs = 0
+    first_move_cutoffs = 0
+    moves = []
+    start = time.perf_counter()
+
+    for moves_played in POSITIONS:
+        moves.append(searcher.best_move(Position.from_moves(moves_played), depth))
+        nodes += searcher.nodes
+        probes += searcher.transposition_table.probes
+        hits += searcher.transposition_table.hits
+        collisions += searcher.transposition_table.collisions
+        overwrites += searcher.transposition_table.overwrites
+        cutoffs += searcher.cutoffs
+        first_move_cutoffs += searcher.first_move_cutoffs
+
+    return (nodes, time.perf_counter() - start, hits / probes if probes else 0.0,
+            first_move_cutoffs / cutoffs if cutoffs else 0.0, collisions, overwrites, moves)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare search algorithms on a fixed position set")
+    parser.add_argument('--depth', type=int, default=7)
+    parser.add_argument('--algorithms', nargs='+', default=list(Searcher.ALGORITHMS))
+    parser.add_argument('--tt-size-mb', type=float, default=16)
+    parser.add_argument('--replacement', choices=TranspositionTable.REPLACEMENTS, default='two-tier')
+    args = parser.parse_args()
+
+    print(f"{len(POSITIONS)} positions, depth {args.depth}, "
+          f"TT {args.tt_size_mb} MB ({args.replacement})")
+    for algorithm in args.algorithms:
+        nodes, elapsed, hit_rate, first_cutoff_rate, collisions, overwrites, moves = run(
+            algorithm, args.depth, args.tt_size_mb, args.replacement)
+        print(f"{algorithm:>10}: {nodes:>9} nodes  {elapsed:7.2f} s  "
+              f"{nodes / elapsed:9.0f} nodes/s  TT hits {hit_rate:5.1%}  "
+              f"first-move cutoffs {first_cutoff_rate:5.1%}  "
+              f"collisions {collisions:>6}  overwrites {overwrites:>6}  "
+              f"moves {''.join(str(col + 1) for col in moves)}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,111 @@
+import bisect
+import mmap
+import os
+from array import array
+from typing import Dict, List, Optional, Tuple
+
+from .position import BOARD_COLS, Position
+from .search import SearchAborted, Searcher
+from .solver import Solver
+
+
+SCORE_BITS = 6
+MOVE_BITS = 3
+PAYLOAD_BITS = SCORE_BITS + MOVE_BITS
+SCORE_OFFSET = 1 << (SCORE_BITS - 1)
+NO_MOVE = (1 << MOVE_BITS) - 1
+UNSOLVED = -SCORE_OFFSET
+
+
+def pack_record(key: int, score: Optional[int], move: Optional[int]) -> int:
+    score = UNSOLVED if score is None else score
+    return (key << PAYLOAD_BITS) | ((score + SCORE_OFFSET) << MOVE_BITS) | (NO_MOVE if move is None else move)
+
+
+def unpack_record(record: int) -> Tuple[int, Optional[int], Optional[int]]:
+    move = record & NO_MOVE
+    score = ((record >> MOVE_BITS) & ((1 << SCORE_BITS) - 1)) - SCORE_OFFSET
+    return (record >> PAYLOAD_BITS, None if score == UNSOLVED else score,
+            None if move == NO_MOVE else move)
+
+
+class OpeningBook:
+    def __init__(self, path: str):
+        self.file = open(path, 'rb')
+        self.map = None
+        self.records = []
+        if os.fstat(self.file.fileno()).st_size:
+            self.map = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+            self.records = memoryview(self.map).cast('Q')
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def probe(self, position: Position) -> Optional[Tuple[Optional[int], Optional[int]]]:
+        key, mirrored = position.canonical_key()
+        index = bisect.bisect_left(self.records, key << PAYLOAD_BITS)
+        if index == len(self.records):
+            return None
+
+        record_key, score, move = unpack_record(self.records[index])
+        if record_key != key:
+            return None
+        if mirrored and move is not None:
+            move = BOARD_COLS - 1 - move
+        return score, move
+
+    def close(self):
+        if self.map is not None:
+            self.records.release()
+            self.map.close()
+        self.file.close()
+
+
+def collect_positions(max_ply: int, min_ply: int = 0) -> Dict[int, Position]:
+    positions = {}
+    seen = set()
+
+    def visit(position):
+        key, mirrored = position.canonical_key()
+        if key in seen:
+            return
+        seen.add(key)
+
+        if position.moves >= min_ply:
+            positions[key] = position.mirror() if mirrored else position.copy()
+        if position.moves == max_ply:
+            return
+
+        for col in position.valid_moves():
+            position.play(col)
+            if not position.last_move_won():
+                visit(position)
+            position.undo()
+
+    visit(Position())
+    return positions
+
+
+def write_book(path: str, records: List[int]):
+    with open(path, 'wb') as book_file:
+        array('Q', sorted(records)).tofile(book_file)
+
+
+def build_book(path: str, max_ply: int, min_ply: int = 0, time_budget_ms: Optional[float] = None,
+               tt_size_mb: float = 64, search_depth: int = 10) -> Tuple[int, int]:
+    positions = collect_positions(max_ply, min_ply)
+    solver = Solver(tt_size_mb)
+    searcher = Searcher(tt_size_mb, algorithm='pvs')
+    records = []
+    unsolved = 0
+
+    for key, position in sorted(positions.items(), key=lambda item: -item[1].moves):
+        try:
+            score, move = solver.solve(position, time_budget_ms)
+        except SearchAborted:
+            unsolved += 1
+            score, move = None, searcher.best_move(position, search_depth, time_budget_ms)
+        records.append(pack_record(key, score, move))
+
+    write_book(path, records)
+    return len(records) - unsolved, unsolved
@@ -0,0 +1,27 @@
+import threading
+import time
+from typing import Optional
+
+
+class SearchContext:
+    def __init__(self, time_budget_ms: Optional[float] = None, node_limit: Optional[int] = None,
+                 stop_event: Optional[threading.Event] = None, check_interval: int = 1024):
+        self.deadline = None
+        if time_budget_ms is not None:
+            self.deadline = time.monotonic() + time_budget_ms / 1000
+
+        self.node_limit = node_limit
+        self.stop_event = stop_event if stop_event is not None else threading.Event()
+        self.check_interval = check_interval
+        self.aborted = False
+
+    def cancel(self):
+        self.stop_event.set()
+
+    def cancelled(self) -> bool:
+        return self.stop_event.is_set()
+
+    def limit_reached(self, nodes: int) -> bool:
+        if self.node_limit is not None and nodes >= self.node_limit:
+            return True
+        return self.deadline is not None and time.monotonic() >= self.deadline
@@ -0,0 +1,168 @@
+from typing import List, Tuple
+
+from .position import BOARD_COLS, BOARD_ROWS, CENTER_MASK, COLUMN_BITS, Position, cell_bit
+
+
+def build_window_table() -> List[Tuple[int, int, int, int]]:
+    horizontal = 0
+    for row in range(BOARD_ROWS):
+        for col in range(BOARD_COLS - 3):
+            horizontal |= cell_bit(row, col)
+
+    vertical = 0
+    for row in range(3, BOARD_ROWS):
+        for col in range(BOARD_COLS):
+            vertical |= cell_bit(row, col)
+
+    diagonal = 0
+    for row in range(3, BOARD_ROWS):
+        for col in range(BOARD_COLS - 3):
+            diagonal |= cell_bit(row, col)
+
+    anti_diagonal = 0
+    for row in range(BOARD_ROWS - 3):
+        for col in range(BOARD_COLS - 3):
+            anti_diagonal |= cell_bit(row, col)
+
+    return [(shift, 2 * shift, 3 * shift, starts)
+            for shift, starts in ((COLUMN_BITS, horizontal), (1, vertical),
+                                  (COLUMN_BITS + 1, diagonal), (COLUMN_BITS - 1, anti_diagonal))]
+
+
+WINDOW_TABLE = build_window_table()
+
+
+def evaluate_window(player_count: int, opponent_count: int) -> float:
+    score = 0
+    empty_count = 4 - player_count - opponent_count
+
+    if player_count == 4:
+        score += 100
+    elif player_count == 3 and empty_count == 1:
+        score += 10
+    elif player_count == 2 and empty_count == 2:
+        score += 2
+
+    if opponent_count == 3 and empty_count == 1:
+        score -= 80
+
+    return score
+
+
+WINDOW_SCORES = [evaluate_window(stones, 0) - evaluate_window(0, stones) for stones in range(5)]
+
+
+def score_windows(a0: int, a1: int, a2: int, a3: int, free: int) -> float:
+    low_sum = a0 ^ a1
+    low_carry = a0 & a1
+    high_sum = a2 ^ a3
+    high_carry = a2 & a3
+
+    bit0 = low_sum ^ high_sum
+    carry = low_sum & high_sum
+    bit1 = low_carry ^ high_carry ^ carry
+    bit2 = (low_carry & high_carry) | (carry & (low_carry ^ high_carry))
+
+    return (WINDOW_SCORES[1] * (free & bit0 & ~(bit1 | bit2)).bit_count()
+            + WINDOW_SCORES[2] * (free & bit1 & ~(bit0 | bit2)).bit_count()
+            + WINDOW_SCORES[3] * (free & bit0 & bit1).bit_count()
+            + WINDOW_SCORES[4] * (free & bit2).bit_count())
+
+
+def evaluate(position: Position) -> float:
+    red = position.stones(1)
+    yellow = red ^ position.mask
+
+    score = 6 * ((red & CENTER_MASK).bit_count() - (yellow & CENTER_MASK).bit_count())
+
+    for shift, double_shift, triple_shift, starts in WINDOW_TABLE:
+        r1 = red >> shift
+        r2 = red >> double_shift
+        r3 = red >> triple_shift
+        y1 = yellow >> shift
+        y2 = yellow >> double_shift
+        y3 = yellow >> triple_shift
+
+        score += score_windows(red, r1, r2, r3, starts & ~(yellow | y1 | y2 | y3))
+        score -= score_windows(yellow, y1, y2, y3, starts & ~(red | r1 | r2 | r3))
+
+    return score
+
+
+def evaluate_for(position: Position, player: int) -> float:
+    score = evaluate(position)
+    return score if player == 1 else -score
+
+
+def build_windows() -> List[int]:
+    windows = []
+    for shift, double_shift, triple_shift, starts in WINDOW_TABLE:
+        while starts:
+            start = starts & -starts
+            windows.append(start | (start << shift) | (start << double_shift) | (start << triple_shift))
+            starts ^= start
+    return windows
+
+
+WINDOWS = build_windows()
+CELL_WINDOWS = [tuple(index for index, window in enumerate(WINDOWS) if window >> bit & 1)
+                for bit in range(BOARD_COLS * COLUMN_BITS)]
+CENTER_SCORES = [6 if (1 << bit) & CENTER_MASK else 0 for bit in range(BOARD_COLS * COLUMN_BITS)]
+
+WINDOW_CODE_SCORES = [evaluate_window(red, yellow) - evaluate_window(yellow, red)
+                      if red + yellow <= 4 else 0
+                      for red in range(5) for yellow in range(5)]
+RED_DELTAS = [WINDOW_CODE_SCORES[code + 5] - WINDOW_CODE_SCORES[code] if code + 5 < 25 else 0
+              for code in range(25)]
+YELLOW_DELTAS = [WINDOW_CODE_SCORES[code + 1] - WINDOW_CODE_SCORES[code] if code % 5 < 4 else 0
+                 for code in range(25)]
+
+
+class EvaluatedPosition(Position):
+    def __init__(self, current: int = 0, mask: int = 0, moves: int = 0):
+        super().__init__(current, mask, moves)
+        red = self.stones(1)
+        yellow = red ^ mask
+
+        self.window_codes = [5 * (red & window).bit_count() + (yellow & window).bit_count()
+                             for window in WINDOWS]
+        self.score = (sum(WINDOW_CODE_SCORES[code] for code in self.window_codes)
+                      + 6 * ((red & CENTER_MASK).bit_count() - (yellow & CENTER_MASK).bit_count()))
+        self.score_history = []
+
+    def relative_score(self) -> float:
+        return self.score if self.moves % 2 == 0 else -self.score
+
+    def play(self, col: int):
+        index = col * COLUMN_BITS + self.heights[col]
+        codes = self.window_codes
+        score = self.score
+        self.score_history.append(score)
+
+        if self.moves % 2 == 0:
+            score += CENTER_SCORES[index]
+            for window in CELL_WINDOWS[index]:
+                code = codes[window]
+                score += RED_DELTAS[code]
+                codes[window] = code + 5
+        else:
+            score -= CENTER_SCORES[index]
+            for window in CELL_WINDOWS[index]:
+                code = codes[window]
+                score += YELLOW_DELTAS[code]
+                codes[window] = code + 1
+
+        self.score = score
+        super().play(col)
+
+    def undo(self):
+        col = self.history[-1]
+        super().undo()
+
+        index = col * COLUMN_BITS + self.heights[col]
+        step = 5 if self.moves % 2 == 0 else 1
+        codes = self.window_codes
+        for window in CELL_WINDOWS[index]:
+            codes[window] -= step
+
+        self.score = self.score_history.pop()
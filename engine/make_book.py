@@ -0,0 +1,25 @@
+import argparse
+import time
+
+from .book import build_book
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Solve opening positions into a binary book")
+    parser.add_argument('output')
+    parser.add_argument('--ply', type=int, default=4)
+    parser.add_argument('--min-ply', type=int, default=0)
+    parser.add_argument('--time-budget-ms', type=float, default=500)
+    parser.add_argument('--tt-size-mb', type=float, default=64)
+    parser.add_argument('--search-depth', type=int, default=10)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    solved, unsolved = build_book(args.output, args.ply, args.min_ply, args.time_budget_ms,
+                                  args.tt_size_mb, args.search_depth)
+    print(f"{solved} positions solved, {unsolved} with a depth-{args.search_depth} move only, "
+          f"{time.perf_counter() - start:.1f} s -> {args.output}")
+
+
+if __name__ == '__main__':
+    main()
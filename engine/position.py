@@ -0,0 +1,200 @@
+from typing import List, Tuple
+
+
+BOARD_ROWS = 6
+BOARD_COLS = 7
+COLUMN_BITS = BOARD_ROWS + 1
+
+BOTTOM_MASK = sum(1 << (col * COLUMN_BITS) for col in range(BOARD_COLS))
+BOARD_MASK = BOTTOM_MASK * ((1 << BOARD_ROWS) - 1)
+CENTER_MASK = ((1 << BOARD_ROWS) - 1) << ((BOARD_COLS // 2) * COLUMN_BITS)
+COLUMN_MASK = (1 << COLUMN_BITS) - 1
+MIRROR_PAIRS = [(COLUMN_MASK << (col * COLUMN_BITS),
+                 COLUMN_MASK << ((BOARD_COLS - 1 - col) * COLUMN_BITS),
+                 (BOARD_COLS - 1 - 2 * col) * COLUMN_BITS)
+                for col in range(BOARD_COLS // 2)]
+MIRROR_CENTER = (COLUMN_MASK << (BOARD_COLS // 2 * COLUMN_BITS)) if BOARD_COLS % 2 else 0
+
+
+def cell_bit(row: int, col: int) -> int:
+    return 1 << (col * COLUMN_BITS + (BOARD_ROWS - 1 - row))
+
+
+def cell_column(cells: int) -> int:
+    return ((cells & -cells).bit_length() - 1) // COLUMN_BITS
+
+
+def mirror_bits(bits: int) -> int:
+    mirrored = bits & MIRROR_CENTER
+    for left, right, shift in MIRROR_PAIRS:
+        mirrored |= ((bits & left) << shift) | ((bits & right) >> shift)
+    return mirrored
+
+
+def build_cell_lines() -> List[List[Tuple[int, int]]]:
+    cell_lines = [[] for _ in range(BOARD_COLS * COLUMN_BITS)]
+
+    for row in range(BOARD_ROWS):
+        for col in range(BOARD_COLS):
+            index = cell_bit(row, col).bit_length() - 1
+            for d_row, d_col, shift in ((0, 1, COLUMN_BITS), (1, 0, 1),
+                                        (-1, 1, COLUMN_BITS + 1), (1, 1, COLUMN_BITS - 1)):
+                line = 0
+                for step in range(-3, 4):
+                    r = row + step * d_row
+                    c = col + step * d_col
+                    if 0 <= r < BOARD_ROWS and 0 <= c < BOARD_COLS:
+                        line |= cell_bit(r, c)
+                cell_lines[index].append((shift, line))
+
+    return cell_lines
+
+
+CELL_LINES = build_cell_lines()
+
+
+class Position:
+    def __init__(self, current: int = 0, mask: int = 0, moves: int = 0):
+        self.current = current
+        self.mask = mask
+        self.moves = moves
+        self.heights = [(mask >> (col * COLUMN_BITS) & ((1 << BOARD_ROWS) - 1)).bit_count()
+                        for col in range(BOARD_COLS)]
+        self.history = []
+
+    @classmethod
+    def from_board(cls, board: List[List[int]]) -> 'Position':
+        red = 0
+        yellow = 0
+        for row in range(BOARD_ROWS):
+            for col in range(BOARD_COLS):
+                if board[row][col] == 1:
+                    red |= cell_bit(row, col)
+                elif board[row][col] == 2:
+                    yellow |= cell_bit(row, col)
+
+        mask = red | yellow
+        moves = mask.bit_count()
+        current = red if moves % 2 == 0 else yellow
+        return cls(current, mask, moves)
+
+    @classmethod
+    def from_moves(cls, moves: str) -> 'Position':
+        position = cls()
+        for move in moves:
+            col = int(move) - 1
+            if (not 0 <= col < BOARD_COLS or not position.can_play(col)
+                    or (position.history and position.last_move_won())):
+                raise ValueError(f"Invalid move sequence: {moves}")
+            position.play(col)
+        return position
+
+    def copy(self) -> 'Position':
+        return type(self)(self.current, self.mask, self.moves)
+
+    def key(self) -> int:
+        return self.current + self.mask
+
+    def canonical_key(self) -> Tuple[int, bool]:
+        key = self.current + self.mask
+        mirrored = mirror_bits(key)
+        if mirrored < key:
+            return mirrored, True
+        return key, False
+
+    def mirror(self) -> 'Position':
+        return type(self)(mirror_bits(self.current), mirror_bits(self.mask), self.moves)
+
+    def red_to_move(self) -> bool:
+        return self.moves % 2 == 0
+
+    def stones(self, player: int) -> int:
+        if (player == 1) == self.red_to_move():
+            return self.current
+        return self.current ^ self.mask
+
+    def can_play(self, col: int) -> bool:
+        return self.heights[col] < BOARD_ROWS
+
+    def valid_moves(self) -> List[int]:
+        return [col for col in range(BOARD_COLS) if self.heights[col] < BOARD_ROWS]
+
+    def play(self, col: int):
+        self.current ^= self.mask
+        self.mask |= 1 << (col * COLUMN_BITS + self.heights[col])
+        self.heights[col] += 1
+        self.moves += 1
+        self.history.append(col)
+
+    def undo(self):
+        col = self.history.pop()
+        self.heights[col] -= 1
+        self.moves -= 1
+        self.mask ^= 1 << (col * COLUMN_BITS + self.heights[col])
+        self.current ^= self.mask
+
+    def possible(self) -> int:
+        return (self.mask + BOTTOM_MASK) & BOARD_MASK
+
+    def cell(self, col: int) -> int:
+        return 1 << (col * COLUMN_BITS + self.heights[col])
+
+    def winning_cells(self, stones: int) -> int:
+        cells = (stones << 1) & (stones << 2) & (stones << 3)
+
+        for shift in (COLUMN_BITS, COLUMN_BITS - 1, COLUMN_BITS + 1):
+            pair = (stones << shift) & (stones << (2 * shift))
+            cells |= pair & (stones << (3 * shift))
+            cells |= pair & (stones >> shift)
+            pair = (stones >> shift) & (stones >> (2 * shift))
+            cells |= pair & (stones << shift)
+            cells |= pair & (stones >> (3 * shift))
+
+        return cells & (BOARD_MASK ^ self.mask)
+
+    def non_losing_moves(self) -> int:
+        possible = self.possible()
+        opponent_wins = self.winning_cells(self.current ^ self.mask)
+        forced = possible & opponent_wins
+        if forced:
+            if forced & (forced - 1):
+                return 0
+            possible = forced
+        return possible & ~(opponent_wins >> 1)
+
+    def is_full(self) -> bool:
+        return self.moves == BOARD_ROWS * BOARD_COLS
+
+    def last_move_won(self) -> bool:
+        stones = self.current ^ self.mask
+        if not self.history:
+            return self.alignment(stones)
+
+        col = self.history[-1]
+        for shift, line in CELL_LINES[col * COLUMN_BITS + self.heights[col] - 1]:
+            m = stones & line
+            m &= m >> shift
+            if m & (m >> (2 * shift)):
+                return True
+
+        return False
+
+    @staticmethod
+    def alignment(stones: int) -> bool:
+        m = stones & (stones >> COLUMN_BITS)
+        if m & (m >> (2 * COLUMN_BITS)):
+            return True
+
+        m = stones & (stones >> (COLUMN_BITS - 1))
+        if m & (m >> (2 * (COLUMN_BITS - 1))):
+            return True
+
+        m = stones & (stones >> (COLUMN_BITS + 1))
+        if m & (m >> (2 * (COLUMN_BITS + 1))):
+            return True
+
+        m = stones & (stones >> 1)
+        if m & (m >> 2):
+            return True
+
+        return False
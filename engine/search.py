@@ -0,0 +1,210 @@
+import math
+import threading
+from typing import List, Optional, Tuple
+
+from .context import SearchContext
+from .evaluation import EvaluatedPosition
+from .position import BOARD_COLS, BOARD_ROWS, COLUMN_BITS, Position, cell_column
+from .transposition import EXACT, LOWER_BOUND, UPPER_BOUND, TranspositionTable
+
+
+class SearchAborted(Exception):
+    pass
+
+
+class Searcher:
+    ALGORITHMS = ('alphabeta', 'pvs')
+
+    def __init__(self, tt_size_mb: float = 16, algorithm: str = 'alphabeta', book=None,
+                 replacement: str = 'two-tier'):
+        if algorithm not in self.ALGORITHMS:
+            raise ValueError(f"Unknown search algorithm: {algorithm}")
+
+        self.transposition_table = TranspositionTable(tt_size_mb, replacement)
+        self.algorithm = algorithm
+        self.book = book
+        self.nodes = 0
+        self.context = SearchContext()
+        self.enforce_limits = False
+        self.reset_stats()
+
+    def reset_stats(self):
+        self.nodes = 0
+        self.cutoffs = 0
+        self.first_move_cutoffs = 0
+        self.killer_moves = [[None, None] for _ in range(BOARD_ROWS * BOARD_COLS + 1)]
+        self.history_scores = [[0] * (BOARD_COLS * COLUMN_BITS) for _ in range(2)]
+
+    def best_move(self, position: Position, depth: Optional[int] = 6,
+                  time_budget_ms: Optional[float] = None,
+                  stop_event: Optional[threading.Event] = None,
+                  context: Optional[SearchContext] = None) -> Optional[int]:
+        self.reset_stats()
+
+        if self.book is not None:
+            entry = self.book.probe(position)
+            if entry is not None and entry[1] is not None:
+                return entry[1]
+
+        forced_col = self.forced_move(position)
+        if forced_col is not None:
+            return forced_col
+
+        if context is None:
+            context = SearchContext(time_budget_ms, stop_event=stop_event)
+        self.context = context
+        self.transposition_table.new_search()
+        position = EvaluatedPosition(position.current, position.mask, position.moves)
+
+        max_depth = BOARD_ROWS * BOARD_COLS - position.moves
+        if depth is not None:
+            max_depth = min(depth, max_depth)
+
+        best_col = None
+        for current_depth in range(1, max_depth + 1):
+            self.enforce_limits = best_col is not None
+            try:
+                score, col = self.negamax(position, current_depth, -math.inf, math.inf)
+            except SearchAborted:
+                context.aborted = True
+                break
+
+            best_col = col
+            if abs(score) >= 1000:
+                break
+
+        self.enforce_limits = False
+        self.context = SearchContext()
+        return best_col
+
+    def forced_move(self, position: Position) -> Optional[int]:
+        possible = position.possible()
+        wins = position.winning_cells(position.current) & possible
+        if wins:
+            return cell_column(wins)
+
+        safe = position.non_losing_moves()
+        if safe:
+            return cell_column(safe) if not safe & (safe - 1) else None
+
+        blocks = position.winning_cells(position.current ^ position.mask) & possible
+        if blocks:
+            return cell_column(blocks)
+        moves = self.valid_moves_ordered(position)
+        return moves[0] if moves else None
+
+    def search_expired(self) -> bool:
+        if self.context.cancelled():
+            return True
+        return self.enforce_limits and self.context.limit_reached(self.nodes)
+
+    def negamax(self, position: EvaluatedPosition, depth: int, alpha: float,
+                beta: float) -> Tuple[float, Optional[int]]:
+
+        self.nodes += 1
+        if self.nodes % self.context.check_interval == 0 and self.search_expired():
+            raise SearchAborted
+
+        if position.last_move_won():
+            return -1000 - depth, None
+        elif position.is_full():
+            return 0, None
+        elif depth == 0:
+            return position.relative_score(), None
+
+        wins = position.winning_cells(position.current) & position.possible()
+        if wins:
+            return 1000 + depth - 1, cell_column(wins)
+
+        candidates = position.non_losing_moves()
+        if not candidates:
+            return -1000 - depth + 2, None
+
+        key, mirrored = position.canonical_key()
+        tt_move = None
+        entry = self.transposition_table.probe(key)
+        if entry is not None:
+            _, entry_depth, flag, entry_score, tt_move, _ = entry
+            if mirrored and tt_move is not None:
+                tt_move = BOARD_COLS - 1 - tt_move
+            if entry_depth >= depth:
+                if flag == EXACT:
+                    return entry_score, tt_move
+                elif flag == LOWER_BOUND:
+                    alpha = max(alpha, entry_score)
+                else:
+                    beta = min(beta, entry_score)
+                if alpha >= beta:
+                    return entry_score, tt_move
+
+        original_alpha = alpha
+        best_score = -math.inf
+        best_col = None
+
+        for index, col in enumerate(self.order_moves(position, tt_move, candidates)):
+            position.play(col)
+            if index == 0 or self.algorithm == 'alphabeta':
+                score = -self.negamax(position, depth - 1, -beta, -alpha)[0]
+            else:
+                score = -self.negamax(position, depth - 1, -alpha - 1, -alpha)[0]
+                if alpha < score < beta:
+                    score = -self.negamax(position, depth - 1, -beta, -alpha)[0]
+            position.undo()
+
+            if score > best_score:
+                best_score = score
+                best_col = col
+
+            alpha = max(alpha, score)
+            if alpha >= beta:
+                self.record_cutoff(position, col, depth, index)
+                break
+
+        if best_score <= original_alpha:
+            flag = UPPER_BOUND
+        elif best_score >= beta:
+            flag = LOWER_BOUND
+        else:
+            flag = EXACT
+        stored_col = BOARD_COLS - 1 - best_col if mirrored and best_col is not None else best_col
+        self.transposition_table.store(key, depth, flag, best_score, stored_col)
+
+        return best_score, best_col
+
+    def order_moves(self, position: Position, tt_move: Optional[int], candidates: int) -> List[int]:
+        killers = self.killer_moves[position.moves]
+        history = self.history_scores[position.moves % 2]
+
+        def move_priority(col):
+            return (col != tt_move,
+                    col not in killers,
+                    -history[position.cell(col).bit_length() - 1])
+
+        return sorted((col for col in self.valid_moves_ordered(position)
+                       if position.cell(col) & candidates), key=move_priority)
+
+    def valid_moves_ordered(self, position: Position) -> List[int]:
+        center_col = BOARD_COLS // 2
+
+        def move_priority(col):
+            return abs(col - center_col)
+
+        return sorted(position.valid_moves(), key=move_priority)
+
+    def record_cutoff(self, position: Position, col: int, depth: int, index: int):
+        self.cutoffs += 1
+        if index == 0:
+            self.first_move_cutoffs += 1
+
+        killers = self.killer_moves[position.moves]
+        if killers[0] != col:
+            killers[1] = killers[0]
+            killers[0] = col
+
+        cell = position.cell(col)
+        self.history_scores[position.moves % 2][cell.bit_length() - 1] += depth * depth
+
+    def first_move_cutoff_rate(self) -> float:
+        if self.cutoffs == 0:
+            return 0.0
+        return self.first_move_cutoffs / self.cutoffs
@@ -0,0 +1,160 @@
+import threading
+from typing import List, Optional, Tuple
+
+from .context import SearchContext
+from .position import BOARD_COLS, BOARD_ROWS, Position, cell_column
+from .search import SearchAborted
+from .transposition import LOWER_BOUND, UPPER_BOUND, TranspositionTable
+
+
+CELLS = BOARD_ROWS * BOARD_COLS
+COLUMN_ORDER = sorted(range(BOARD_COLS), key=lambda col: abs(col - BOARD_COLS // 2))
+
+
+def plies_to_end(moves: int, score: int) -> int:
+    if score > 0:
+        return 2 * (CELLS // 2 + 1 - score - moves // 2) - 1
+    elif score < 0:
+        return 2 * (CELLS // 2 + 1 + score - (moves + 1) // 2)
+    return CELLS - moves
+
+
+class Solver:
+    def __init__(self, tt_size_mb: float = 16, book=None, replacement: str = 'two-tier'):
+        self.transposition_table = TranspositionTable(tt_size_mb, replacement)
+        self.book = book
+        self.nodes = 0
+        self.context = SearchContext()
+
+    def solve(self, position: Position, time_budget_ms: Optional[float] = None,
+              stop_event: Optional[threading.Event] = None,
+              context: Optional[SearchContext] = None) -> Tuple[int, Optional[int]]:
+        position = position.copy()
+        self.nodes = 0
+        self.transposition_table.new_search()
+        if context is None:
+            context = SearchContext(time_budget_ms, stop_event=stop_event)
+        self.context = context
+
+        try:
+            return self.solve_position(position)
+        except SearchAborted:
+            context.aborted = True
+            raise
+        finally:
+            self.context = SearchContext()
+
+    def solve_position(self, position: Position) -> Tuple[int, Optional[int]]:
+        if position.is_full():
+            return 0, None
+
+        wins = position.winning_cells(position.current) & position.possible()
+        if wins:
+            return (CELLS + 1 - position.moves) // 2, cell_column(wins)
+
+        if self.book is not None:
+            entry = self.book.probe(position)
+            if entry is not None and entry[0] is not None:
+                return entry
+
+        if not position.non_losing_moves():
+            return -((CELLS - position.moves) // 2), position.valid_moves()[0]
+
+        low = -((CELLS - position.moves) // 2)
+        high = (CELLS + 1 - position.moves) // 2
+        while low < high:
+            middle = low + (high - low) // 2
+            if middle <= 0 and int(low / 2) < middle:
+                middle = int(low / 2)
+            elif middle >= 0 and int(high / 2) > middle:
+                middle = int(high / 2)
+
+            score = self.negamax(position, middle, middle + 1)
+            if score <= middle:
+                high = score
+            else:
+                low = score
+
+        return low, self.best_move(position, low)
+
+    def best_move(self, position: Position, score: int) -> Optional[int]:
+        for col in self.ordered_moves(position, None, position.non_losing_moves()):
+            position.play(col)
+            child_score = self.negamax(position, -score, -score + 1)
+            position.undo()
+            if child_score <= -score:
+                return col
+        return None
+
+    def search_expired(self) -> bool:
+        return self.context.cancelled() or self.context.limit_reached(self.nodes)
+
+    def negamax(self, position: Position, alpha: int, beta: int) -> int:
+        self.nodes += 1
+        if self.nodes % self.context.check_interval == 0 and self.search_expired():
+            raise SearchAborted
+
+        if position.winning_cells(position.current) & position.possible():
+            return (CELLS + 1 - position.moves) // 2
+
+        candidates = position.non_losing_moves()
+        if not candidates:
+            return -((CELLS - position.moves) // 2)
+
+        if position.moves >= CELLS - 2:
+            return 0
+
+        lower = -((CELLS - 2 - position.moves) // 2)
+        if alpha < lower:
+            alpha = lower
+            if alpha >= beta:
+                return alpha
+
+        upper = (CELLS - 1 - position.moves) // 2
+        if beta > upper:
+            beta = upper
+            if alpha >= beta:
+                return beta
+
+        key, mirrored = position.canonical_key()
+        tt_move = None
+        entry = self.transposition_table.probe(key)
+        if entry is not None:
+            _, _, flag, entry_score, tt_move, _ = entry
+            if mirrored and tt_move is not None:
+                tt_move = BOARD_COLS - 1 - tt_move
+            if flag == UPPER_BOUND and entry_score < beta:
+                beta = entry_score
+            elif flag == LOWER_BOUND and entry_score > alpha:
+                alpha = entry_score
+            if alpha >= beta:
+                return entry_score
+
+        depth = CELLS - position.moves
+        for col in self.ordered_moves(position, tt_move, candidates):
+            position.play(col)
+            score = -self.negamax(position, -beta, -alpha)
+            position.undo()
+
+            if score >= beta:
+                self.transposition_table.store(key, depth, LOWER_BOUND, score,
+                                               BOARD_COLS - 1 - col if mirrored else col)
+                return score
+            if score > alpha:
+                alpha = score
+
+        self.transposition_table.store(key, depth, UPPER_BOUND, alpha, None)
+        return alpha
+
+    def ordered_moves(self, position: Position, tt_move: Optional[int],
+                      candidates: int) -> List[int]:
+        threats = {}
+        for col in COLUMN_ORDER:
+            cell = position.cell(col)
+            if cell & candidates:
+                threats[col] = (position.winning_cells(position.current | cell) & ~cell).bit_count()
+
+        def move_priority(col):
+            return (col != tt_move, -threats[col])
+
+        return sorted(threats, key=move_priority)
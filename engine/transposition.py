@@ -0,0 +1,180 @@
+import mmap
+import os
+from array import array
+from typing import Optional, Tuple
+
+
+EXACT = 0
+LOWER_BOUND = 1
+UPPER_BOUND = 2
+
+SNAPSHOT_MAGIC = 0x3254543450
+HEADER_WORDS = 4
+GENERATION_MASK = 0xFFFF
+SCORE_OFFSET = 1 << 31
+NO_MOVE = 7
+HASH_MULTIPLIER = 0x9E3779B97F4A7C15
+HASH_MASK = (1 << 64) - 1
+
+
+def pack_entry(entry: Tuple[int, int, int, float, Optional[int], int]) -> Tuple[int, int]:
+    key, depth, flag, score, move, generation = entry
+    return ((key << 1) | 1,
+            (depth << 56) | (flag << 54) | ((NO_MOVE if move is None else move) << 48)
+            | (generation << 32) | (int(score) + SCORE_OFFSET))
+
+
+def unpack_entry(key_word: int, data_word: int) -> Optional[Tuple[int, int, int, float, Optional[int], int]]:
+    if not key_word & 1:
+        return None
+    move = (data_word >> 48) & 7
+    return (key_word >> 1, data_word >> 56, (data_word >> 54) & 3,
+            (data_word & 0xFFFFFFFF) - SCORE_OFFSET, None if move == NO_MOVE else move,
+            (data_word >> 32) & GENERATION_MASK)
+
+
+class TranspositionTable:
+    ENTRY_BYTES = 16
+    REPLACEMENTS = ('two-tier', 'depth', 'always')
+
+    def __init__(self, size_mb: float = 16, replacement: str = 'two-tier'):
+        if replacement not in self.REPLACEMENTS:
+            raise ValueError(f"Unknown replacement policy: {replacement}")
+
+        self.replacement = replacement
+        self.slots = 2 if replacement == 'two-tier' else 1
+        buckets = max(1, int(size_mb * 1024 * 1024) // (self.ENTRY_BYTES * self.slots))
+        self.size = 1 << (buckets.bit_length() - 1)
+        self.index_shift = 64 - (buckets.bit_length() - 1)
+        self.words = array('Q', [0]) * (2 * self.slots * self.size)
+        self.generation = 0
+        self.snapshot_file = None
+        self.snapshot_map = None
+        self.snapshot = None
+        self.reset_stats()
+
+    def reset_stats(self):
+        self.probes = 0
+        self.hits = 0
+        self.carried_hits = 0
+        self.collisions = 0
+        self.overwrites = 0
+
+    def new_search(self):
+        self.generation = (self.generation + 1) & GENERATION_MASK
+        self.reset_stats()
+
+    def probe(self, key: int) -> Optional[Tuple[int, int, int, float, Optional[int], int]]:
+        self.probes += 1
+        words = self.words
+        key_word = (key << 1) | 1
+        index = 2 * self.slots * (((key * HASH_MULTIPLIER) & HASH_MASK) >> self.index_shift)
+        if words[index] != key_word:
+            if self.slots == 1 or words[index + 2] != key_word:
+                if words[index] & 1:
+                    self.collisions += 1
+                return None
+            index += 2
+
+        entry = unpack_entry(key_word, words[index + 1])
+        self.hits += 1
+        if entry[5] != self.generation:
+            self.carried_hits += 1
+        return entry
+
+    def store(self, key: int, depth: int, flag: int, score: float, move: Optional[int]):
+        words = self.words
+        key_word = (key << 1) | 1
+        index = 2 * self.slots * (((key * HASH_MULTIPLIER) & HASH_MASK) >> self.index_shift)
+        old_key_word = words[index]
+        old_data_word = words[index + 1]
+
+        if not old_key_word & 1 or self.replacement == 'always' or depth >= old_data_word >> 56:
+            replace = True
+        else:
+            fresh = (old_data_word >> 32) & GENERATION_MASK == self.generation
+            replace = (old_key_word == key_word) == fresh
+
+        if self.slots == 1 or old_key_word == key_word:
+            if not replace:
+                return
+            evicted = old_key_word
+            if self.slots == 2 and words[index + 2] == key_word:
+                words[index + 2] = 0
+        elif replace:
+            evicted = words[index + 2]
+            if old_key_word & 1:
+                words[index + 2] = old_key_word
+                words[index + 3] = old_data_word
+            else:
+                evicted = 0
+                if words[index + 2] == key_word:
+                    words[index + 2] = 0
+        else:
+            index += 2
+            evicted = words[index]
+
+        if evicted & 1 and evicted != key_word:
+            self.overwrites += 1
+        words[index], words[index + 1] = pack_entry((key, depth, flag, score, move, self.generation))
+
+    def hit_rate(self) -> float:
+        if self.probes == 0:
+            return 0.0
+        return self.hits / self.probes
+
+    def save(self, path: str):
+        self.close_snapshot()
+        with open(path, 'wb') as snapshot_file:
+            array('Q', [SNAPSHOT_MAGIC, self.size, self.slots, self.generation]).tofile(snapshot_file)
+            self.words.tofile(snapshot_file)
+
+    def open_snapshot(self, path: str):
+        self.close_snapshot()
+        snapshot_file = open(path, 'rb')
+        snapshot_map = None
+        try:
+            size = os.fstat(snapshot_file.fileno()).st_size
+            if size < HEADER_WORDS * 8 or size % 8:
+                raise ValueError(f"Not a transposition table snapshot: {path}")
+            snapshot_map = mmap.mmap(snapshot_file.fileno(), 0, access=mmap.ACCESS_COPY)
+            snapshot = memoryview(snapshot_map).cast('Q')
+            if (snapshot[0] != SNAPSHOT_MAGIC or snapshot[1] != self.size or snapshot[2] != self.slots
+                    or len(snapshot) != HEADER_WORDS + 2 * self.slots * self.size):
+                snapshot.release()
+                raise ValueError(f"Snapshot {path} does not match a table of {self.size} entries")
+        except BaseException:
+            if snapshot_map is not None:
+                snapshot_map.close()
+            snapshot_file.close()
+            raise
+
+        self.generation = snapshot[3]
+        self.snapshot_file = snapshot_file
+        self.snapshot_map = snapshot_map
+        self.snapshot = snapshot
+        self.words = snapshot[HEADER_WORDS:]
+
+    def close_snapshot(self):
+        if self.snapshot is None:
+            return
+        words = array('Q')
+        words.frombytes(self.words.tobytes())
+        self.release_snapshot()
+        self.words = words
+
+    def release_snapshot(self):
+        if self.snapshot is None:
+            return
+        self.words.release()
+        self.snapshot.release()
+        self.snapshot_map.close()
+        self.snapshot_file.close()
+        self.snapshot = None
+        self.snapshot_map = None
+        self.snapshot_file = None
+
+    def clear(self):
+        self.release_snapshot()
+        self.words = array('Q', [0]) * (2 * self.slots * self.size)
+        self.reset_stats()
@@ -1,7 +1,13 @@
 import tkinter as tk
 from tkinter import messagebox
 import math
-from typing import List, Tuple, Optional
+import os
+import queue
+import threading
+from typing import List, Optional, Tuple
+
+from engine import (OpeningBook, Position, SearchAborted, SearchContext, Searcher, Solver,
+                    plies_to_end)
 
 
 class Connect4Game:
@@ -12,6 +18,16 @@ class Connect4Game:
         self.MARGIN = 20
         self.BOARD_PADDING = 15
         self.ANIMATION_SPEED = 8
+        self.TT_SIZE_MB = 16
+        self.AI_DEPTH = 6
+        self.AI_TIME_BUDGET_MS = None
+        self.AI_NODE_LIMIT = None
+        self.AI_ALGORITHM = 'pvs'
+        self.AI_LEVEL = 'standard'
+        self.AI_SOLVER_BUDGET_MS = 3000
+        self.AI_PONDER = True
+        self.BOOK_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'opening_book.bin')
+        self.TT_SNAPSHOT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'transposition.bin')
 
         self.COLORS = {
             'background': '#2c2444',
@@ -36,6 +52,20 @@ class Connect4Game:
         self.animating = False
         self.ai_player = None
         self.game_started = False
+        self.book = OpeningBook(self.BOOK_PATH) if os.path.exists(self.BOOK_PATH) else None
+        self.engine = Searcher(self.TT_SIZE_MB, algorithm=self.AI_ALGORITHM, book=self.book)
+        self.solver = Solver(self.TT_SIZE_MB, book=self.book)
+        if os.path.exists(self.TT_SNAPSHOT_PATH):
+            try:
+                self.engine.transposition_table.open_snapshot(self.TT_SNAPSHOT_PATH)
+            except (OSError, ValueError):
+                self.engine.transposition_table.clear()
+
+        self.search_thread = None
+        self.search_cancel = None
+        self.search_generation = 0
+        self.search_results = queue.Queue()
+        self.ponder_results = {}
 
         self.setup_gui()
 
@@ -44,6 +74,7 @@ class Connect4Game:
         self.root.title("Puissance 4 - IA")
         self.root.configure(bg=self.COLORS['background'])
         self.root.resizable(False, False)
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
 
         window_width = self.COLS * self.CELL_SIZE + 2 * self.MARGIN + 2 * self.BOARD_PADDING
         window_height = self.ROWS * self.CELL_SIZE + 4 * self.MARGIN + 150 + 2 * self.BOARD_PADDING
@@ -139,6 +170,8 @@ class Connect4Game:
         self.update_display()
         if self.ai_player == self.current_player:
             self.calculate_suggestion()
+        else:
+            self.start_pondering()
 
     def draw_board(self):
         self.canvas.delete("all")
@@ -431,6 +464,7 @@ class Connect4Game:
         if row == -1:
             return False
 
+        self.cancel_search()
         self.animate_piece_drop(row, col)
         return True
 
@@ -457,9 +491,9 @@ class Connect4Game:
                     self.canvas.delete("animated_piece")
                     self.board[target_row][col] = self.current_player
                     self.draw_board()
-                    self.check_winner()
-                    self.switch_player()
+                    self.check_winner(target_row, col)
                     self.animating = False
+                    self.switch_player()
                     return
                 else:
                     velocity = -velocity * damping
@@ -489,44 +523,25 @@ class Connect4Game:
 
         animate_step(start_y)
 
-    def check_winner(self):
-        for row in range(self.ROWS):
-            for col in range(self.COLS - 3):
-                if (self.board[row][col] != 0 and
-                        self.board[row][col] == self.board[row][col + 1] ==
-                        self.board[row][col + 2] == self.board[row][col + 3]):
-                    self.game_over = True
-                    self.winner = self.board[row][col]
-                    return
-
-        for row in range(self.ROWS - 3):
-            for col in range(self.COLS):
-                if (self.board[row][col] != 0 and
-                        self.board[row][col] == self.board[row + 1][col] ==
-                        self.board[row + 2][col] == self.board[row + 3][col]):
-                    self.game_over = True
-                    self.winner = self.board[row][col]
-                    return
-
-        for row in range(self.ROWS - 3):
-            for col in range(self.COLS - 3):
-                if (self.board[row][col] != 0 and
-                        self.board[row][col] == self.board[row + 1][col + 1] ==
-                        self.board[row + 2][col + 2] == self.board[row + 3][col + 3]):
-                    self.game_over = True
-                    self.winner = self.board[row][col]
-                    return
-
-        for row in range(self.ROWS - 3):
-            for col in range(3, self.COLS):
-                if (self.board[row][col] != 0 and
-                        self.board[row][col] == self.board[row + 1][col - 1] ==
-                        self.board[row + 2][col - 2] == self.board[row + 3][col - 3]):
-                    self.game_over = True
-                    self.winner = self.board[row][col]
-                    return
-
-        if all(self.board[0][col] != 0 for col in range(self.COLS)):
+    def check_winner(self, row: int, col: int):
+        player = self.board[row][col]
+
+        for d_row, d_col in ((0, 1), (1, 0), (1, 1), (1, -1)):
+            count = 1
+            for sign in (1, -1):
+                r = row + sign * d_row
+                c = col + sign * d_col
+                while 0 <= r < self.ROWS and 0 <= c < self.COLS and self.board[r][c] == player:
+                    count += 1
+                    r += sign * d_row
+                    c += sign * d_col
+
+            if count >= 4:
+                self.game_over = True
+                self.winner = player
+                return
+
+        if all(self.board[0][c] != 0 for c in range(self.COLS)):
             self.game_over = True
             self.winner = 0
 
@@ -539,6 +554,7 @@ class Connect4Game:
             else:
                 self.suggested_col = None
                 self.suggestion_label.config(text="")
+                self.start_pondering()
         else:
             self.show_game_over()
 
@@ -578,6 +594,8 @@ class Connect4Game:
         self.root.after(500, lambda: messagebox.showinfo("Fin de partie", message))
 
     def reset_game(self):
+        self.cancel_search()
+        self.ponder_results = {}
         self.board = [[0 for _ in range(self.COLS)] for _ in range(self.ROWS)]
         self.current_player = 1
         self.game_over = False
@@ -595,200 +613,157 @@ class Connect4Game:
         self.draw_board()
 
     def calculate_suggestion(self):
+        self.cancel_search()
+
         if self.game_over or self.current_player != self.ai_player or not self.game_started:
             self.suggested_col = None
             self.suggestion_label.config(text="")
             return
 
-        best_col = self.get_best_move()
-        self.suggested_col = best_col
-
-        if best_col is not None:
-            color_name = "Rouge" if self.ai_player == 1 else "Jaune"
-            self.suggestion_label.config(
-                text=f"💡 Suggestion IA {color_name}: Colonne {best_col + 1}",
-                fg=self.COLORS['suggestion']
-            )
-        else:
-            self.suggestion_label.config(text="")
+        cached = self.ponder_results.get(Position.from_board(self.board).key())
+        if cached is not None:
+            self.show_suggestion(*cached)
+            return
 
-    def get_best_move(self, depth: int = 6) -> Optional[int]:
-        _, best_col = self.minimax(self.board, depth, -math.inf, math.inf, True)
-        return best_col
+        self.search_generation += 1
+        self.search_cancel = threading.Event()
+        board = [row[:] for row in self.board]
+        self.search_thread = threading.Thread(target=self.run_search,
+                                              args=(board, self.search_generation,
+                                                    self.search_cancel, self.search_thread),
+                                              daemon=True)
+        self.suggested_col = None
+        self.suggestion_label.config(text="🤔 L'IA réfléchit...", fg=self.COLORS['suggestion'])
+        self.search_thread.start()
+        self.root.after(16, self.poll_search)
+
+    def cancel_search(self):
+        if self.search_cancel is not None:
+            self.search_cancel.set()
+        self.search_generation += 1
+
+    def run_search(self, board: List[List[int]], generation: int,
+                   cancel: threading.Event, previous: Optional[threading.Thread]):
+        if previous is not None:
+            previous.join()
+        if cancel.is_set():
+            return
 
-    def minimax(self, board: List[List[int]], depth: int, alpha: float,
-                beta: float, maximizing: bool) -> Tuple[float, Optional[int]]:
+        best_col, score = self.compute_suggestion(board, cancel)
+        if not cancel.is_set():
+            self.search_results.put((generation, best_col, score))
+
+    def compute_suggestion(self, board: List[List[int]],
+                           cancel: threading.Event) -> Tuple[Optional[int], Optional[int]]:
+        if self.AI_LEVEL == 'perfect':
+            try:
+                score, best_col = self.solve(board, SearchContext(self.AI_SOLVER_BUDGET_MS,
+                                                                  stop_event=cancel))
+                return best_col, score
+            except SearchAborted:
+                pass
+
+        context = SearchContext(self.AI_TIME_BUDGET_MS, self.AI_NODE_LIMIT, cancel)
+        return self.get_best_move(self.AI_DEPTH, board, context), None
+
+    def start_pondering(self):
+        self.cancel_search()
+        if not self.AI_PONDER or self.game_over or not self.game_started:
+            return
 
-        winner = self.check_winner_board(board)
-        if winner == 1:
-            return 1000 + depth, None
-        elif winner == 2:
-            return -1000 - depth, None
-        elif self.is_board_full(board) or depth == 0:
-            return self.evaluate_board(board), None
+        self.search_cancel = threading.Event()
+        board = [row[:] for row in self.board]
+        self.search_thread = threading.Thread(target=self.run_ponder,
+                                              args=(board, self.current_player, self.search_cancel,
+                                                    self.search_thread),
+                                              daemon=True)
+        self.search_thread.start()
+
+    def run_ponder(self, board: List[List[int]], player: int, cancel: threading.Event,
+                   previous: Optional[threading.Thread]):
+        if previous is not None:
+            previous.join()
+        if cancel.is_set():
+            return
 
-        best_col = None
+        self.ponder_results = {}
+        position = Position.from_board(board)
+        for col in self.engine.valid_moves_ordered(position):
+            position.play(col)
+            key = position.key()
+            finished = position.last_move_won() or position.is_full()
+            position.undo()
+            if finished:
+                continue
+
+            reply_board = [row[:] for row in board]
+            row = max(r for r in range(self.ROWS) if board[r][col] == 0)
+            reply_board[row][col] = player
+            result = self.compute_suggestion(reply_board, cancel)
+            if cancel.is_set():
+                return
+            self.ponder_results[key] = result
+
+    def poll_search(self):
+        try:
+            generation, best_col, score = self.search_results.get_nowait()
+        except queue.Empty:
+            if self.search_thread is not None and self.search_thread.is_alive():
+                self.root.after(16, self.poll_search)
+            return
 
-        if maximizing:
-            max_eval = -math.inf
-            for col in self.get_valid_moves(board):
-                new_board = self.make_move_copy(board, col, 1)
-                eval_score, _ = self.minimax(new_board, depth - 1, alpha, beta, False)
+        if generation != self.search_generation:
+            self.root.after(16, self.poll_search)
+            return
 
-                if eval_score > max_eval:
-                    max_eval = eval_score
-                    best_col = col
+        self.show_suggestion(best_col, score)
 
-                alpha = max(alpha, eval_score)
-                if beta <= alpha:
-                    break
+    def show_suggestion(self, best_col: Optional[int], score: Optional[int] = None):
+        if (self.game_over or self.animating or self.current_player != self.ai_player
+                or not self.game_started):
+            return
 
-            return max_eval, best_col
+        self.suggested_col = best_col
 
+        if best_col is not None:
+            color_name = "Rouge" if self.ai_player == 1 else "Jaune"
+            text = f"💡 Suggestion IA {color_name}: Colonne {best_col + 1}"
+            if score is not None:
+                text += f" ({self.describe_score(score)})"
+            self.suggestion_label.config(text=text, fg=self.COLORS['suggestion'])
         else:
-            min_eval = math.inf
-            for col in self.get_valid_moves(board):
-                new_board = self.make_move_copy(board, col, 2)
-                eval_score, _ = self.minimax(new_board, depth - 1, alpha, beta, True)
-
-                if eval_score < min_eval:
-                    min_eval = eval_score
-                    best_col = col
-
-                beta = min(beta, eval_score)
-                if beta <= alpha:
-                    break
-
-            return min_eval, best_col
-
-    def evaluate_board_for_ai(self, board: List[List[int]]) -> float:
-        ai_score = self.evaluate_windows(board, self.ai_player)
-        opponent_score = self.evaluate_windows(board, 3 - self.ai_player)
-
-        center_col = self.COLS // 2
-        center_bonus = 0
-        for row in range(self.ROWS):
-            if board[row][center_col] == self.ai_player:
-                center_bonus += 6
-            elif board[row][center_col] == (3 - self.ai_player):
-                center_bonus -= 6
-
-        return ai_score - opponent_score + center_bonus
-
-    def get_valid_moves_ordered(self, board: List[List[int]]) -> List[int]:
-        valid_moves = self.get_valid_moves(board)
-        center_col = self.COLS // 2
-
-        def move_priority(col):
-            return abs(col - center_col)
-
-        return sorted(valid_moves, key=move_priority)
-
-    def evaluate_board(self, board: List[List[int]]) -> float:
-        score = 0
-
-        center_col = self.COLS // 2
-        for row in range(self.ROWS):
-            if board[row][center_col] == 1:
-                score += 6
-            elif board[row][center_col] == 2:
-                score -= 6
-
-        score += self.evaluate_windows(board, 1) - self.evaluate_windows(board, 2)
-
-        return score
-
-    def evaluate_windows(self, board: List[List[int]], player: int) -> float:
-        score = 0
-
-        for row in range(self.ROWS):
-            for col in range(self.COLS - 3):
-                window = [board[row][col + i] for i in range(4)]
-                score += self.evaluate_window(window, player)
-
-        for row in range(self.ROWS - 3):
-            for col in range(self.COLS):
-                window = [board[row + i][col] for i in range(4)]
-                score += self.evaluate_window(window, player)
-
-        for row in range(self.ROWS - 3):
-            for col in range(self.COLS - 3):
-                window = [board[row + i][col + i] for i in range(4)]
-                score += self.evaluate_window(window, player)
-
-        for row in range(self.ROWS - 3):
-            for col in range(3, self.COLS):
-                window = [board[row + i][col - i] for i in range(4)]
-                score += self.evaluate_window(window, player)
-
-        return score
-
-    def evaluate_window(self, window: List[int], player: int) -> float:
-        score = 0
-        opponent = 3 - player
-
-        player_count = window.count(player)
-        empty_count = window.count(0)
-        opponent_count = window.count(opponent)
-
-        if player_count == 4:
-            score += 100
-        elif player_count == 3 and empty_count == 1:
-            score += 10
-        elif player_count == 2 and empty_count == 2:
-            score += 2
-
-        if opponent_count == 3 and empty_count == 1:
-            score -= 80
-
-        return score
-
-    def get_valid_moves(self, board: List[List[int]]) -> List[int]:
-        return [col for col in range(self.COLS) if board[0][col] == 0]
-
-    def make_move_copy(self, board: List[List[int]], col: int, player: int) -> List[List[int]]:
-        new_board = [row[:] for row in board]
-
-        for row in range(self.ROWS - 1, -1, -1):
-            if new_board[row][col] == 0:
-                new_board[row][col] = player
-                break
-
-        return new_board
+            self.suggestion_label.config(text="")
 
-    def check_winner_board(self, board: List[List[int]]) -> Optional[int]:
-        for row in range(self.ROWS):
-            for col in range(self.COLS - 3):
-                if (board[row][col] != 0 and
-                        board[row][col] == board[row][col + 1] ==
-                        board[row][col + 2] == board[row][col + 3]):
-                    return board[row][col]
+        self.draw_board()
 
-        for row in range(self.ROWS - 3):
-            for col in range(self.COLS):
-                if (board[row][col] != 0 and
-                        board[row][col] == board[row + 1][col] ==
-                        board[row + 2][col] == board[row + 3][col]):
-                    return board[row][col]
-
-        for row in range(self.ROWS - 3):
-            for col in range(self.COLS - 3):
-                if (board[row][col] != 0 and
-                        board[row][col] == board[row + 1][col + 1] ==
-                        board[row + 2][col + 2] == board[row + 3][col + 3]):
-                    return board[row][col]
-
-        for row in range(self.ROWS - 3):
-            for col in range(3, self.COLS):
-                if (board[row][col] != 0 and
-                        board[row][col] == board[row + 1][col - 1] ==
-                        board[row + 2][col - 2] == board[row + 3][col - 3]):
-                    return board[row][col]
-
-        return None
-
-    def is_board_full(self, board: List[List[int]]) -> bool:
-        return all(board[0][col] != 0 for col in range(self.COLS))
+    def get_best_move(self, depth: Optional[int] = 6,
+                      board: Optional[List[List[int]]] = None,
+                      context: Optional[SearchContext] = None) -> Optional[int]:
+        position = Position.from_board(self.board if board is None else board)
+        return self.engine.best_move(position, depth, context=context)
+
+    def solve(self, board: Optional[List[List[int]]] = None,
+              context: Optional[SearchContext] = None) -> Tuple[int, Optional[int]]:
+        position = Position.from_board(self.board if board is None else board)
+        return self.solver.solve(position, context=context)
+
+    def describe_score(self, score: int) -> str:
+        moves = sum(cell != 0 for row in self.board for cell in row)
+        plies = plies_to_end(moves, score)
+        if score > 0:
+            return f"victoire en {plies} coups"
+        elif score < 0:
+            return f"défaite en {plies} coups"
+        return "match nul"
+
+    def on_close(self):
+        self.cancel_search()
+        if self.search_thread is not None:
+            self.search_thread.join()
+        try:
+            self.engine.transposition_table.save(self.TT_SNAPSHOT_PATH)
+        finally:
+            self.root.destroy()
 
     def run(self):
         self.root.mainloop()
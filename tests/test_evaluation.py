@@ -0,0 +1,103 @@
+import random
+from typing import List
+
+from engine.evaluation import EvaluatedPosition, evaluate
+from engine.position import BOARD_COLS, BOARD_ROWS, Position
+
+
+def evaluate_window(window: List[int], player: int) -> float:
+    score = 0
+    opponent = 3 - player
+
+    player_count = window.count(player)
+    empty_count = window.count(0)
+    opponent_count = window.count(opponent)
+
+    if player_count == 4:
+        score += 100
+    elif player_count == 3 and empty_count == 1:
+        score += 10
+    elif player_count == 2 and empty_count == 2:
+        score += 2
+
+    if opponent_count == 3 and empty_count == 1:
+        score -= 80
+
+    return score
+
+
+def evaluate_windows(board: List[List[int]], player: int) -> float:
+    score = 0
+
+    for row in range(BOARD_ROWS):
+        for col in range(BOARD_COLS - 3):
+            score += evaluate_window([board[row][col + i] for i in range(4)], player)
+
+    for col in range(BOARD_COLS):
+        for row in range(BOARD_ROWS - 3):
+            score += evaluate_window([board[row + i][col] for i in range(4)], player)
+
+    for row in range(BOARD_ROWS - 3):
+        for col in range(BOARD_COLS - 3):
+            score += evaluate_window([board[row + i][col + i] for i in range(4)], player)
+
+    for row in range(3, BOARD_ROWS):
+        for col in range(BOARD_COLS - 3):
+            score += evaluate_window([board[row - i][col + i] for i in range(4)], player)
+
+    return score
+
+
+def evaluate_board(board: List[List[int]]) -> float:
+    score = 0
+
+    center_col = BOARD_COLS // 2
+    for row in range(BOARD_ROWS):
+        if board[row][center_col] == 1:
+            score += 6
+        elif board[row][center_col] == 2:
+            score -= 6
+
+    score += evaluate_windows(board, 1) - evaluate_windows(board, 2)
+
+    return score
+
+
+def board_from_moves(moves: List[int]) -> List[List[int]]:
+    board = [[0] * BOARD_COLS for _ in range(BOARD_ROWS)]
+    heights = [0] * BOARD_COLS
+    for ply, col in enumerate(moves):
+        board[BOARD_ROWS - 1 - heights[col]][col] = 1 if ply % 2 == 0 else 2
+        heights[col] += 1
+    return board
+
+
+def check_position(position: EvaluatedPosition):
+    expected = evaluate_board(board_from_moves(position.history))
+    assert position.score == expected
+    assert evaluate(position) == expected
+    assert evaluate(Position(position.current, position.mask, position.moves)) == expected
+    assert EvaluatedPosition(position.current, position.mask, position.moves).score == expected
+    assert position.relative_score() == (expected if position.moves % 2 == 0 else -expected)
+
+
+def test_incremental_score_matches_list_reference():
+    rng = random.Random(2024)
+
+    for _ in range(25):
+        position = EvaluatedPosition()
+        check_position(position)
+
+        while position.valid_moves() and not (position.history and position.last_move_won()):
+            position.play(rng.choice(position.valid_moves()))
+            check_position(position)
+
+            if position.history and rng.random() < 0.3:
+                for _ in range(rng.randint(1, len(position.history))):
+                    position.undo()
+                    check_position(position)
+
+
+def test_empty_board_scores_zero():
+    assert EvaluatedPosition().score == 0
+    assert evaluate(Position()) == 0
@@ -0,0 +1,57 @@
+from engine import Position
+from main import Connect4Game
+
+
+class FakeWidget:
+    def __init__(self):
+        self.options = {}
+
+    def config(self, **options):
+        self.options.update(options)
+
+    def delete(self, *tags):
+        pass
+
+
+class FakeRoot:
+    def __init__(self):
+        self.pending = []
+
+    def after(self, delay, callback):
+        self.pending.append(callback)
+
+    def run_pending(self):
+        while self.pending:
+            self.pending.pop(0)()
+
+
+class HeadlessGame(Connect4Game):
+    def setup_gui(self):
+        self.root = FakeRoot()
+        self.canvas = FakeWidget()
+        self.player_label = FakeWidget()
+        self.suggestion_label = FakeWidget()
+
+    def draw_board(self):
+        pass
+
+    def draw_animated_token(self, center_x, center_y, player):
+        return []
+
+
+def test_pondered_suggestion_is_shown_after_drop():
+    game = HeadlessGame()
+    game.ai_player = 2
+    game.game_started = True
+
+    game.board[game.ROWS - 1][3] = 1
+    game.ponder_results[Position.from_board(game.board).key()] = (4, None)
+    game.board[game.ROWS - 1][3] = 0
+
+    game.animate_piece_drop(game.ROWS - 1, 3)
+    game.root.run_pending()
+
+    assert not game.animating
+    assert game.current_player == 2
+    assert game.suggested_col == 4
+    assert "Colonne 5" in game.suggestion_label.options['text']
@@ -0,0 +1,64 @@
+import random
+from functools import lru_cache
+from typing import Optional
+
+from engine import Position, Solver, solve
+from engine.solver import CELLS
+
+
+@lru_cache(maxsize=None)
+def reference_score(current: int, mask: int, moves: int) -> int:
+    position = Position(current, mask, moves)
+    if position.is_full():
+        return 0
+
+    best = -CELLS
+    for col in position.valid_moves():
+        position.play(col)
+        if position.last_move_won():
+            score = (CELLS + 1 - moves) // 2
+        else:
+            score = -reference_score(position.current, position.mask, position.moves)
+        position.undo()
+        best = max(best, score)
+    return best
+
+
+def move_score(position: Position, col: int) -> int:
+    position.play(col)
+    if position.last_move_won():
+        score = (CELLS + 1 - (position.moves - 1)) // 2
+    else:
+        score = -reference_score(position.current, position.mask, position.moves)
+    position.undo()
+    return score
+
+
+def random_position(rng: random.Random, moves: int) -> Optional[Position]:
+    position = Position()
+    for _ in range(moves):
+        position.play(rng.choice(position.valid_moves()))
+        if position.last_move_won():
+            return None
+    return Position(position.current, position.mask, position.moves)
+
+
+def test_late_positions_match_brute_force():
+    rng = random.Random(14)
+    solver = Solver(1)
+    checked = 0
+
+    while checked < 12:
+        position = random_position(rng, rng.randint(24, 30))
+        if position is None:
+            continue
+
+        score, move = solver.solve(position)
+        expected = reference_score(position.current, position.mask, position.moves)
+        assert score == expected
+        assert move_score(position, move) == expected
+        checked += 1
+
+
+def test_readme_example():
+    assert solve(Position.from_moves('255235465151743522746644')) == (-9, 0)